@@ -1,9 +1,119 @@
 import os
-
-from PyQt5.QtWidgets import *
-from PyQt5.QtCore import *
-from PyQt5.QtGui import *
+import sys
+
+from collections import deque
+from contextlib import contextmanager
+from functools import lru_cache, partial, reduce
+from operator import or_
+from os.path import basename
+from PyQt5.QtWidgets import (QApplication, QFileDialog, QGridLayout, QHBoxLayout, QLabel, QListWidget, QListWidgetItem,
+                             QMainWindow, QMessageBox, QProgressBar, QPushButton, QToolBar, QToolButton, QVBoxLayout, QWidget)
+from PyQt5.QtCore import QSize, Qt, QTimer, pyqtSignal
+from PyQt5.QtGui import QBrush, QColor, QFont, QIcon, QPainter, QPen, QPixmap
 from pathlib import Path
+from stat import S_ISREG
+
+# style key -> (objectName, pseudo element -> {property: value}); serialized once by Window.flush_styles.
+# Each widget has its own key, stored in its 'style_key' dynamic property, so widgets sharing a name keep
+# separate rules; the entry is dropped when the widget is destroyed.
+_STYLE_REGISTRY = {}
+# Static rules shared by every widget of a role, matched on the 'role' dynamic property.
+_BASE_STYLE_SHEET = ('QPushButton[role="button"] { border:none; }'
+                     'QToolButton[role="tool_button"] { border:none; }')
+_styles_dirty = False
+_style_window = None
+
+
+def _mark_styles_dirty():
+    """
+    Flag the application stylesheet as stale. Once the window has been flushed, a single re-flush is
+    queued on the event loop so any number of style changes made in the meantime cost one parse.
+    """
+    global _styles_dirty
+    if not _styles_dirty:
+        _styles_dirty = True
+        if _style_window is not None:
+            QTimer.singleShot(0, _style_window.flush_styles)
+
+
+def _register_style(widget, pseudos):
+    """
+    Register the rules of a widget with the application stylesheet, under the widget's own style key.
+    """
+    key = widget.property('style_key')
+    if key is None:
+        key = f'{id(widget):x}'
+        widget.setProperty('style_key', key)
+        widget.destroyed.connect(partial(_release_style, key))
+    _STYLE_REGISTRY[key] = (widget.objectName(), pseudos)
+    _mark_styles_dirty()
+
+
+def _release_style(key, *_):
+    """
+    Remove the rules registered under a style key, connected to the destroyed signal of the widget.
+    """
+    if _STYLE_REGISTRY.pop(key, None) is not None:
+        _mark_styles_dirty()
+
+
+_ALIGN_TABLE = {'center': Qt.AlignCenter, 'top': Qt.AlignTop, 'bot': Qt.AlignBottom, 'right': Qt.AlignRight,
+                'left': Qt.AlignLeft}
+_ALIGN_CACHE = {}
+
+
+def _resolve_alignment(alignment):
+    """
+    Return the Qt alignment for an alignment string, memoized per string.
+
+    Args:
+        alignment (str): The alignment string ('center', 'right', 'left', 'centerh', 'centerv', 'top', 'bot', etc.)
+
+    Returns:
+        Qt.Alignment: The corresponding Qt alignment, Qt.AlignJustify when no alignment is given.
+    """
+    if not alignment:
+        return Qt.AlignJustify
+    total_align = _ALIGN_CACHE.get(alignment)
+    if total_align is None:
+        total_align = reduce(or_, (flag for key, flag in _ALIGN_TABLE.items() if key in alignment), 0)
+        _ALIGN_CACHE[alignment] = total_align
+    return total_align
+
+
+_LAYOUT_TYPES = {'v': QVBoxLayout, 'h': QHBoxLayout, 'g': QGridLayout}
+_WIDGET_CACHE_SIZE = 64  # Detached widgets kept per type by Layout.reset_layout, older ones are deleted
+
+_IMG_EXTS = frozenset({'.jpg', '.png', '.jpeg'})
+_PDF_EXTS = frozenset({'.pdf'})
+_AUDIO_EXTS = frozenset({'.ogg', '.wav', '.mp3', '.raw'})
+_PATH_EXTS = {'image': _IMG_EXTS, 'pdf': _PDF_EXTS, 'audio': _AUDIO_EXTS}
+
+
+# Fonts and icons are shared between widgets; both are only ever built from the GUI thread.
+@lru_cache(maxsize=64)
+def _font(family, size):
+    """ Return a cached QFont for the given family and point size. """
+    return QFont(family, size)
+
+
+@lru_cache(maxsize=64)
+def _icon(path):
+    """ Return a cached QIcon loaded from the given image path. """
+    return QIcon(path)
+
+
+# Colors are passed around as RGB tuples, which double as cache keys; callers convert lists with tuple().
+@lru_cache(maxsize=256)
+def _qcolor(rgb):
+    """ Return a cached QColor for an RGB tuple. """
+    return QColor(*rgb)
+
+
+@lru_cache(maxsize=256)
+def _rgb(rgb):
+    """ Return the stylesheet rgb() string for an RGB tuple. """
+    return f'rgb({rgb[0]}, {rgb[1]}, {rgb[2]})'
 
 
 class Window(QMainWindow):
@@ -19,9 +129,10 @@ class Window(QMainWindow):
             resizeable (bool): If False, the window cannot be resized. Default is False.
             titlebar (bool): If False, the window will be frameless. Default is True.
         """
-        self.app = QApplication([])
+        self.app = QApplication.instance() or QApplication(sys.argv)
         super().__init__()
-        self.screen_size = QSize(self.app.desktop().width(), self.app.desktop().height())
+        self._screen_geometry = None  # Queried on first use, see screen_geometry
+        self.resizeable = resizeable
         self.size = QSize(width, height)
         self.toolbar = None  # Toolbar will be initialized in enable_toolbar method
         self.central = QWidget()
@@ -36,11 +147,47 @@ class Window(QMainWindow):
         if icon:
             self.setWindowIcon(QIcon(icon))
 
-        # Center the window on the screen
-        self.setGeometry((self.screen_size.width() // 2 - self.size.width() // 2),
-                         (self.screen_size.height() // 2 - self.size.height() // 2),
-                         self.size.width(), self.size.height())
-        self.setStyleSheet(f'background:rgb{background_color}')  # Set background color
+        # Background color, emitted as the first rule of the application stylesheet
+        self.setObjectName('window')
+        self.background_style = f'#window, #window * {{ background:{_rgb(tuple(background_color))}; }}'
+        self.style_sheet = None
+
+    @property
+    def screen_geometry(self):
+        """
+        The available geometry of the primary screen, queried from the platform on first access.
+        """
+        if self._screen_geometry is None:
+            self._screen_geometry = self.app.primaryScreen().availableGeometry()
+        return self._screen_geometry
+
+    @property
+    def screen_size(self):
+        """
+        The available size of the primary screen.
+        """
+        return self.screen_geometry.size()
+
+    def center(self):
+        """
+        Center the window on the screen. Fixed-size windows are only moved, their size is already set.
+        """
+        screen = self.screen_geometry
+        x = screen.x() + (screen.width() - self.size.width()) // 2
+        y = screen.y() + (screen.height() - self.size.height()) // 2
+        if self.resizeable:
+            self.setGeometry(x, y, self.size.width(), self.size.height())
+        else:
+            self.move(x, y)
+
+    def show_error(self, message):
+        """
+        Shows an error message in a dialog over the window.
+
+        Args:
+            message (str): The message to show.
+        """
+        QMessageBox.warning(self, self.windowTitle(), message)
 
     def enable_toolbar(self, toolbar_widget, background=(255, 255, 255), area=Qt.TopToolBarArea, hideable=False,
                        movable=False):
@@ -55,17 +202,40 @@ class Window(QMainWindow):
             movable (bool): If True, the toolbar can be moved. Default is False.
         """
         self.toolbar = QToolBar()
-        self.toolbar.setStyleSheet(f'background:rgb{background};padding:0px;margin:0px')
+        self.toolbar.setStyleSheet(f'background:{_rgb(tuple(background))};padding:0px;margin:0px')
         self.toolbar.setMovable(movable)
         if not hideable:
             self.toolbar.setContextMenuPolicy(Qt.PreventContextMenu)
         self.toolbar.addWidget(toolbar_widget)
         self.addToolBar(area, self.toolbar)
 
+    def flush_styles(self):
+        """
+        Serialize every registered widget style into one stylesheet and install it on the application.
+        """
+        global _styles_dirty, _style_window
+        parts = [_BASE_STYLE_SHEET, self.background_style]
+        for style_key, (name, pseudos) in _STYLE_REGISTRY.items():
+            widget_selector = '%s[style_key="%s"]' % ('#' + name if name else '*', style_key)
+            for pseudo, properties in pseudos.items():
+                if properties:
+                    selector = widget_selector if pseudo == 'none' else '%s::%s' % (widget_selector, pseudo)
+                    declarations = ';'.join(f'{key}:{value}' for key, value in properties.items())
+                    parts.append('%s { %s }' % (selector, declarations))
+        style_sheet = ''.join(parts)
+
+        if style_sheet != self.style_sheet:
+            self.style_sheet = style_sheet
+            self.app.setStyleSheet(style_sheet)
+        _styles_dirty = False
+        _style_window = self
+
     def run(self):
         """
         Show the window and start the application event loop.
         """
+        self.center()
+        self.flush_styles()
         self.show()
         self.app.exec_()
 
@@ -86,10 +256,12 @@ class Layout:
             grid_location (tuple, optional): Grid location if parent layout is QGridLayout. Default is None.
         """
         self.layout = self.get_layout(layout_type)
+        self.is_grid = layout_type == 'g'
         self.parent = parent
-        self.alignment = self.get_alignment(alignment)
+        self.alignment = _ALIGN_CACHE.get(alignment) or _resolve_alignment(alignment)
         self.styles = {}
         self.grid_location = grid_location
+        self._widget_cache = {}  # Widget type -> widgets detached by reset_layout
 
         if self.alignment:
             self.layout.setAlignment(self.alignment)
@@ -111,10 +283,10 @@ class Layout:
                 self.background_widget.setFixedWidth(size.width())
             if size.height() != 0:
                 self.background_widget.setFixedHeight(size.height())
-        if background_color:
-            self.set_background(background_color)
         self.layout.setContentsMargins(2, 2, 2, 2)
         self.background_widget.setObjectName(name)
+        if background_color:
+            self.set_background(background_color)
 
     def get_layout(self, layout_type):
         """
@@ -129,59 +301,61 @@ class Layout:
         Raises:
             ValueError: If an invalid layout type is provided.
         """
-        if layout_type == 'v':
-            return QVBoxLayout()
-        elif layout_type == 'h':
-            return QHBoxLayout()
-        elif layout_type == 'g':
-            return QGridLayout()
-        else:
+        try:
+            return _LAYOUT_TYPES[layout_type]()
+        except KeyError:
             raise ValueError(
-                "Invalid layout type. Use 'v' for QVBoxLayout, 'h' for QHBoxLayout, or 'g' for QGridLayout.")
+                "Invalid layout type. Use 'v' for QVBoxLayout, 'h' for QHBoxLayout, or 'g' for QGridLayout.") from None
 
-    def get_alignment(self, alignment):
-        """
-        Return the appropriate Qt alignment based on alignment string.
-
-        Args:
-            alignment (str): The alignment type.
-
-        Returns:
-            Qt.Alignment: The corresponding Qt alignment.
-        """
-        total_align = 0
-        if alignment:
-            if 'center' in alignment:
-                total_align |= Qt.AlignCenter
-            if 'top' in alignment:
-                total_align |= Qt.AlignTop
-            if 'bot' in alignment:
-                total_align |= Qt.AlignBottom
-            if 'right' in alignment:
-                total_align |= Qt.AlignRight
-            if 'left' in alignment:
-                total_align |= Qt.AlignLeft
-            return total_align
-        else:
-            return Qt.AlignJustify
+    get_alignment = staticmethod(_resolve_alignment)
 
     def reset_layout(self):
         """
-        Remove all widgets from the layout.
+        Remove all widgets from the layout, keeping them detached in the widget cache for reuse by acquire.
+        Past _WIDGET_CACHE_SIZE widgets of a type, the oldest cached one is deleted.
         """
         if self.layout is not None:
             while self.layout.count():
                 item = self.layout.takeAt(0)
                 widget = item.widget()
                 if widget is not None:
-                    widget.deleteLater()
+                    widget.hide()
+                    widget.setParent(None)
+                    cached = self._widget_cache.setdefault(type(widget), deque(maxlen=_WIDGET_CACHE_SIZE))
+                    if len(cached) == cached.maxlen:
+                        cached.popleft().deleteLater()
+                    cached.append(widget)
+
+    def acquire(self, cls, *args, **kwargs):
+        """
+        Return a widget of the given class, reusing one removed by reset_layout when available.
+
+        Args:
+            cls (type): The widget class, constructed as cls(self, *args, **kwargs) when none is cached.
+
+        Returns:
+            QWidget: The widget, added back to this layout. A reused widget keeps its previous content.
+        """
+        cached = self._widget_cache.get(cls)
+        if not cached:
+            return cls(self, *args, **kwargs)
+        widget = cached.pop()
+        if isinstance(widget, Widget):
+            widget.layout = self
+            widget.show()
+        else:
+            self.addWidget(widget)
+        widget.setVisible(True)
+        return widget
 
     def update_style(self):
         """
-        Update the stylesheet of the background widget based on the styles dictionary.
+        Register the styles dictionary of the background widget with the application stylesheet.
         """
-        styles = [f'{key}:{value};' for key, value in self.styles.items()]
-        self.background_widget.setStyleSheet(f'#{self.background_widget.objectName()} {{ {"".join(styles)} }}')
+        if self.styles:
+            _register_style(self.background_widget, {'none': self.styles})
+        elif self.background_widget.property('style_key') is not None:
+            _release_style(self.background_widget.property('style_key'))
 
     def enable_border(self, border_width, border_color):
         """
@@ -201,7 +375,7 @@ class Layout:
         Args:
             background_color (tuple): RGB values for the background color.
         """
-        self.styles['background-color'] = f'rgb({background_color[0]}, {background_color[1]}, {background_color[2]})'
+        self.styles['background-color'] = _rgb(tuple(background_color))
         self.update_style()
 
     def addWidget(self, widget, grid_layout=None):
@@ -241,6 +415,7 @@ class Widget(QWidget):
     """
     Base widget class that all other widget components will inherit from.
     """
+    _style_suspended = False
 
     def __init__(self, container_layout=None, name=None, size: QSize = None, font_size=None, font=None, color=None,
                  grid_location=None):
@@ -271,7 +446,7 @@ class Widget(QWidget):
 
     def show(self):
         """ Adds the widget to the layout and displays it. """
-        if type(self.layout.layout) == QGridLayout:
+        if self.layout.is_grid:
             self.layout.addWidget(self, self.grid_location)
         else:
             self.layout.addWidget(self)
@@ -287,20 +462,17 @@ class Widget(QWidget):
         Returns:
             Path or bool: The valid path object if valid, False otherwise.
         """
-        temp_path = Path(path)
-
-        if temp_path.exists() and temp_path.is_file():
-            if type == 'image':
-                if temp_path.suffix in ['.jpg', '.png', '.jpeg']:
-                    return temp_path
-            if type == 'pdf':
-                if temp_path.suffix in ['.pdf']:
-                    return temp_path
-            if type == 'audio':
-                if temp_path.suffix in ['.ogg', '.wav', '.mp3', '.raw']:
-                    return temp_path
-        elif type == 'folder' and temp_path.exists():
-            return temp_path
+        try:
+            path_stat = os.stat(path)
+        except OSError:
+            print("Incorrect file path")
+            return False
+
+        if S_ISREG(path_stat.st_mode):
+            if os.path.splitext(path)[1].lower() in _PATH_EXTS.get(type, ()):
+                return Path(path)
+        elif type == 'folder':
+            return Path(path)
         else:
             print("Incorrect file path")
             return False
@@ -312,25 +484,23 @@ class Widget(QWidget):
         Args:
             size (QSize, optional): The size to set for the widget. Defaults to None.
         """
-        if size is not none:
+        if size is not None:
             self.size = size
-        if self.size.width() != 0:
-            self.setFixedWidth(self.size.width())
-        if self.size.height() != 0:
-            self.setFixedHeight(self.size.height())
+        width, height = self.size.width(), self.size.height()
+        if width != 0 and not self.minimumWidth() == self.maximumWidth() == width:
+            self.setFixedWidth(width)
+        if height != 0 and not self.minimumHeight() == self.maximumHeight() == height:
+            self.setFixedHeight(height)
 
     def update_style(self):
-        """ Updates the stylesheet of the widget based on the current styles. """
-        styles = ""
-        for pseudo in self.styles:
-            if pseudo == 'none':
-                styles += f"#{self.objectName()} {{" + "".join(
-                    f'{key}:{value}; ' for key, value in self.styles[pseudo].items()) + "}"
-            else:
-                styles += f"#{self.objectName()}::{pseudo} {{" + "".join(
-                    f'{key}:{value};' for key, value in self.styles[pseudo].items()) + "}"
+        """
+        Registers the widget styles with the application stylesheet.
 
-        self.setStyleSheet(styles)
+        Widgets created without a name are given one, since rules are matched by object name.
+        """
+        if not self.objectName():
+            self.setObjectName(f'{type(self).__name__}_{id(self):x}')
+        _register_style(self, self.styles)
 
     def add_style(self, pseudo_element, style_property, style_value):
         """
@@ -344,33 +514,41 @@ class Widget(QWidget):
         if pseudo_element not in self.styles.keys():
             self.styles[pseudo_element] = {}
         self.styles[pseudo_element][style_property] = style_value
-        self.update_style()
+        if not self._style_suspended:
+            self.update_style()
 
-    def get_alignment(self, alignment):
+    def set_styles(self, rules: dict):
         """
-        Returns the Qt alignment constant based on the alignment string.
+        Adds several styles to the widget with a single stylesheet update.
 
         Args:
-            alignment (str): The alignment string ('center', 'right', 'left', etc.)
+            rules (dict): The styles to add, mapping each pseudo element to a dict of CSS properties and values.
+        """
+        for pseudo_element, properties in rules.items():
+            self.styles.setdefault(pseudo_element, {}).update(properties)
+        if not self._style_suspended:
+            self.update_style()
 
-        Returns:
-            Qt.Alignment: The corresponding Qt alignment constant.
-        """
-        total_align = 0
-        if alignment:
-            if 'center' in alignment:
-                total_align |= Qt.AlignCenter
-            if 'top' in alignment:
-                total_align |= Qt.AlignTop
-            if 'bot' in alignment:
-                total_align |= Qt.AlignBottom
-            if 'right' in alignment:
-                total_align |= Qt.AlignRight
-            if 'left' in alignment:
-                total_align |= Qt.AlignLeft
-            return total_align
-        else:
-            return Qt.AlignJustify
+    def begin_style_batch(self):
+        """ Records subsequent add_style calls without applying them. """
+        self._style_suspended = True
+
+    def end_style_batch(self):
+        """ Applies the styles recorded since begin_style_batch in a single update. """
+        self._style_suspended = False
+        if self.styles:
+            self.update_style()
+
+    @contextmanager
+    def _styles(self):
+        """ Context manager wrapping begin_style_batch/end_style_batch. """
+        self.begin_style_batch()
+        try:
+            yield
+        finally:
+            self.end_style_batch()
+
+    get_alignment = staticmethod(_resolve_alignment)
 
 
 class Button(QPushButton, Widget):
@@ -394,18 +572,18 @@ class Button(QPushButton, Widget):
         QPushButton.__init__(self)
         Widget.__init__(self, container_layout=container_layout, name=name, size=size, font_size=font_size)
 
+        self.setProperty('role', 'button')
         if icon:
             icon_path = self.check_path(icon, 'image')
             if icon_path:
-                self.setIcon(QIcon(str(icon_path)))
+                self.setIcon(_icon(str(icon_path)))
                 self.setIconSize(self.size)
         elif text:
             self.setText(text)
-            self.setFont(QFont(self.font, self.font_size))
+            self.setFont(_font(self.font, self.font_size))
         if action:
             self.clicked.connect(action)
 
-        self.add_style('none', 'border', 'none')
         self.setFixedSize(self.size)
         self.show()
 
@@ -419,7 +597,7 @@ class Button(QPushButton, Widget):
         """
         image_path = self.check_path(file_path, 'image')
         if image_path:
-            self.setIcon(QIcon(str(image_path)))
+            self.setIcon(_icon(str(image_path)))
             if size:
                 self.setIconSize(size)
                 self.setFixedSize(size)
@@ -446,19 +624,20 @@ class Label(QLabel, Widget):
             color (tuple, optional): The RGB color of the label text. Defaults to None.
             grid_location (tuple, optional): The location in the grid if the layout is a QGridLayout. Defaults to None.
         """
-        Widget.__init__(self, container_layout=container_layout, size=size, font_size=font_size, font=font, color=color,
-                        grid_location=grid_location)
-        QLabel.__init__(self, text)
-        self.alignment = self.get_alignment(alignment)
+        QLabel.__init__(self)
+        Widget.__init__(self, container_layout=container_layout, name=name, size=size, font_size=font_size, font=font,
+                        color=color, grid_location=grid_location)
+        with self._styles():
+            self.setProperty('role', 'label')
+            self.setText(text)
+            self.alignment = self.get_alignment(alignment)
 
-        if name:
-            self.setObjectName(name)
-        if size:
-            self.set_size(size)
-        self.setFont(QFont(self.font, self.font_size))
-        if color:
-            self.add_style('none', 'color', f'rgb{color}')
-        self.setAlignment(self.alignment)
+            if size:
+                self.set_size(size)
+            self.setFont(_font(self.font, self.font_size))
+            if color:
+                self.add_style('none', 'color', _rgb(tuple(color)))
+            self.setAlignment(self.alignment)
         self.show()
 
     def add_style(self, pseudo_element, style_property, style_value):
@@ -511,13 +690,16 @@ class ToolButton(QToolButton, Widget):
         """
         super().__init__(container_layout=container_layout, font=font, font_size=font_size, size=size, color=color)
         QToolButton.__init__(self)
-        self.setText(text)
-        self.setFont(QFont(self.font, self.font_size))
-        self.setStyleSheet(f'border:none;color:rgb{color}')
-        if tooltip:
-            self.setToolTip(tooltip)
-        if action:
-            self.clicked.connect(action)
+        with self._styles():
+            self.setProperty('role', 'tool_button')
+            self.setText(text)
+            self.setFont(_font(self.font, self.font_size))
+            if color:
+                self.add_style('none', 'color', _rgb(tuple(color)))
+            if tooltip:
+                self.setToolTip(tooltip)
+            if action:
+                self.clicked.connect(action)
 
         self.show()
 
@@ -526,6 +708,7 @@ class ScaleBar(QProgressBar, Widget):
     """
     ScaleBar widget class inheriting from QProgressBar and Widget.
     """
+    clicked = pyqtSignal(object)
 
     def __init__(self, container_layout, name=None, action=None, size: QSize = None, color=None, default_text=False):
         """
@@ -534,39 +717,42 @@ class ScaleBar(QProgressBar, Widget):
         Args:
             container_layout (Layout): The layout container for the scale bar.
             name (str, optional): The name identifier for the scale bar. Defaults to None.
-            action (function, optional): The function to be executed on mouse press event. Defaults to None.
+            action (function, optional): The function connected to the clicked signal, called with the mouse press
+                event. Defaults to None.
             size (QSize, optional): The size of the scale bar. Defaults to None.
             color (tuple, optional): The RGB color of the scale bar. Defaults to None.
             default_text (bool, optional): Flag indicating whether to show default text on the scale bar. Defaults to False.
         """
-        super().__init__(container_layout=container_layout, size=size, color=color)
         QProgressBar.__init__(self)
-        self.progress = 0
-        self.action = action
-        if name:
-            self.setObjectName(name)
-        if size:
-            if size.width() != 0:
-                self.setFixedWidth(size.width())
-            if size.height() != 0:
-                self.setFixedHeight(size.height())
-        if not default_text:
-            self.setTextVisible(False)
-        if color:
-            self.add_style('chunk', 'background-color', color)
+        Widget.__init__(self, container_layout=container_layout, name=name, size=size, color=color)
+        with self._styles():
+            self.setProperty('role', 'scale_bar')
+            self.progress = 0
+            self.action = action
+            if size:
+                if size.width() != 0:
+                    self.setFixedWidth(size.width())
+                if size.height() != 0:
+                    self.setFixedHeight(size.height())
+            if not default_text:
+                self.setTextVisible(False)
+            if color:
+                self.add_style('chunk', 'background-color', color)
+            if action:
+                self.clicked.connect(action)
 
         self.setRange(0, 100)
         self.show()
 
     def mousePressEvent(self, event):
         """
-        Overrides the default mouse press event to execute custom action.
+        Overrides the default mouse press event to emit the clicked signal on left clicks.
 
         Args:
             event (QMouseEvent): The mouse press event object.
         """
         if event.button() == Qt.LeftButton:
-            self.action(event)
+            self.clicked.emit(event)
 
 
 class List(QListWidget, Widget):
@@ -586,27 +772,28 @@ class List(QListWidget, Widget):
             color (tuple, optional): The RGB color of the list background. Defaults to None.
             side (str, optional): The side on which buttons are aligned ('left' or 'right'). Defaults to 'left'.
         """
-        Widget.__init__(self, container_layout=container_layout, size=size)
         QListWidget.__init__(self)
+        Widget.__init__(self, container_layout=container_layout, name=name, size=size)
 
         self.inner_layout = Layout(container_layout, f'{self.objectName()}_inner_layout', 'v', size=size)
         self.add_item_function = None
         self.change_item_function = None
         self.delete_item_function = None
+        self._item_pool = deque(maxlen=256)  # Detached ListItems kept for reuse by add_item
 
-        if name:
-            self.setObjectName(name)
-        if color:
-            self.add_style('none', 'background-color', color)
-        if size:
-            self.setFixedSize(size)
+        with self._styles():
+            if color:
+                self.add_style('none', 'background-color', color)
+            if size:
+                self.setFixedSize(size)
 
         self.load_buttons(side)
         self.inner_layout.addWidget(self)
 
     def load_buttons(self, side):
         """
-        Loads buttons for adding and deleting items to/from the list.
+        Loads the layout holding the add and delete buttons. The buttons themselves are created by create_buttons
+        once an add or delete function is registered.
 
         Args:
             side (str): The side on which buttons are aligned ('left' or 'right').
@@ -614,10 +801,18 @@ class List(QListWidget, Widget):
         self.buttons_layout = Layout(self.inner_layout, f'{self.objectName()}_button_layout', 'h', size=QSize(0, 30))
         self.buttons_layout.layout.setAlignment(
             self.get_alignment(alignment=side) | self.get_alignment(alignment='bot'))
-        self.add_button = Button(self.buttons_layout, icon='assets/img/add_button.png', size=QSize(20, 20),
-                                 action=self.add_item)
-        self.delete_button = Button(self.buttons_layout, icon='assets/img/delete_button.png', size=QSize(20, 20),
-                                    action=self.delete_item)
+        self.add_button = None
+        self.delete_button = None
+
+    def create_buttons(self):
+        """
+        Creates the buttons for adding and deleting items to/from the list, if they do not exist yet.
+        """
+        if self.add_button is None:
+            self.add_button = Button(self.buttons_layout, icon='assets/img/add_button.png', size=QSize(20, 20),
+                                     action=self.add_item)
+            self.delete_button = Button(self.buttons_layout, icon='assets/img/delete_button.png', size=QSize(20, 20),
+                                        action=self.delete_item)
 
     def add_item(self):
         """
@@ -625,7 +820,12 @@ class List(QListWidget, Widget):
         """
         file_name, _ = QFileDialog.getOpenFileName(self, 'Add Item', filter=self.item_filter)
         if file_name != '':
-            new_item = ListItem(self, file_name.split('/')[-1], file_name)
+            if self._item_pool:
+                new_item = self._item_pool.pop()
+                new_item.assign(basename(file_name), file_name)
+                self.addItem(new_item)
+            else:
+                new_item = ListItem(self, basename(file_name), file_name)
             if self.add_item_function:
                 self.add_item_function()
 
@@ -635,7 +835,10 @@ class List(QListWidget, Widget):
         """
         index = int(self.currentRow())
         if index != -1:
-            self.takeItem(index)
+            item = self.takeItem(index)
+            if isinstance(item, ListItem):
+                item.assign('', None)
+                self._item_pool.append(item)
 
             if self.delete_item_function:
                 self.delete_item_function(index=index)
@@ -648,6 +851,7 @@ class List(QListWidget, Widget):
             function (function): The function to be executed.
         """
         self.add_item_function = function
+        self.create_buttons()
 
     def set_change_item_function(self, function):
         """
@@ -666,6 +870,7 @@ class List(QListWidget, Widget):
             function (function): The function to be executed, which should accept `index` as a keyword argument.
         """
         self.delete_item_function = function
+        self.create_buttons()
 
     def set_item_filter(self, filter=None):
         """
@@ -695,11 +900,20 @@ class ListItem(QListWidgetItem, Widget):
         Widget.__init__(self)
         QListWidgetItem.__init__(self)
         self.parent_list = parent_list
+        self.assign(name, value)
+        self.parent_list.addItem(self)
+
+    def assign(self, name, value):
+        """
+        Sets the display text and value of the item, used when reusing a pooled item.
+
+        Args:
+            name (str): The name or display text of the list item.
+            value (str): The value or associated data of the list item.
+        """
         self.name = name
         self.value = value
-
         self.setText(self.name)
-        self.parent_list.addItem(self)
 
 
 class ShapeWidget(Widget):
@@ -713,19 +927,30 @@ class ShapeWidget(Widget):
         self.setAttribute(Qt.WA_StyledBackground, True)
 
         self.set_size()
+        self._pen = QPen(Qt.NoPen)  # Used until change_color is given an outline color
+        self._brush = QBrush(Qt.NoBrush)  # Used until change_color is given a fill color
+        self.change_color(outline_color, fill_color)
+        self._rect = self.rect().adjusted(2, 2, -2, -2)
+
+    def change_color(self, outline_color=None, fill_color=None):
+        if outline_color:
+            self.outline_color = outline_color
+            self._pen = QPen(_qcolor(tuple(self.outline_color)), 2, Qt.SolidLine)
+        if fill_color:
+            self.fill_color = fill_color
+            self._brush = QBrush(_qcolor(tuple(self.fill_color)), Qt.SolidPattern)
+        self.update()
+
+    def resizeEvent(self, event):
+        self._rect = self.rect().adjusted(2, 2, -2, -2)
+        super().resizeEvent(event)
 
     def paintEvent(self, event):
         painter = QPainter(self)
         painter.setRenderHint(QPainter.Antialiasing)
-
-        pen = QPen(QColor(*self.outline_color), 2, Qt.SolidLine)
-        brush = QBrush(QColor(*self.fill_color), Qt.SolidPattern)
-
-        painter.setPen(pen)
-        painter.setBrush(brush)
-
-        rect = self.rect().adjusted(2, 2, -2, -2)
-        painter.drawEllipse(rect)
+        painter.setPen(self._pen)
+        painter.setBrush(self._brush)
+        painter.drawEllipse(self._rect)
 
 
 class Shape(Widget):
@@ -754,9 +979,10 @@ class Shape(Widget):
 
     def change_color(self, outline_color=None, fill_color=None):
         if outline_color:
-            self.outline_colorc = outline_color
+            self.outline_color = outline_color
         if fill_color:
             self.fill_color = fill_color
+        self.shape.change_color(outline_color, fill_color)
 
     def set_text(self, text, font_size=None, font=None, color=(0, 0, 0)):
         if font:
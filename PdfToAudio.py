@@ -3,10 +3,289 @@ import GUI
 import sys
 import shutil
 import atexit
-import PyPDF2
+import time
+import wave
+import queue
+import hashlib
+import weakref
 import pyttsx3
+import threading
+import multiprocessing
 import media_player as mp
-from tempfile import NamedTemporaryFile
+from contextlib import suppress
+from functools import partial
+from PyQt5.QtCore import QObject, QProcess, QThread, pyqtSignal, pyqtSlot
+from tempfile import NamedTemporaryFile, mkstemp
+from concurrent.futures import Future, ProcessPoolExecutor
+
+try:
+    from pypdf import PdfReader
+except ImportError:  # PyPDF2 is the older, slower release of pypdf with the same reader API
+    from PyPDF2 import PdfReader
+
+CACHE_DIR = os.path.join('assets', 'cache')
+CACHE_SIZE = 50  # Number of documents kept in the cache
+STALE_PART_AGE = 60 * 60  # Seconds after which a .part file in the cache is left over from an interrupted write
+PARALLEL_MIN_PAGES = 16  # Smaller documents are extracted sequentially, spawning worker processes costs more
+MERGE_BLOCK_FRAMES = 64 * 1024  # Audio frames copied at a time when joining speech chunks
+READ_BLOCK_SIZE = 64 * 1024  # Characters read at a time from a cached text
+_speech_lock = threading.Lock()  # Guards the creation of the shared speech thread
+
+
+def _cleanup_files(paths):
+    """
+    Remove the files of a list, skipping the ones already gone. Registered with weakref.finalize, so it must
+    not hold a reference to the owner of the list.
+
+    :param paths: Paths of the files to remove.
+    """
+    for path in paths:
+        with suppress(FileNotFoundError):
+            os.remove(path)
+
+
+_worker_reader = None  # PdfReader of a worker process, opened once by _open_worker_reader
+
+
+def _open_worker_reader(pdf_path):
+    """
+    Open the PDF in a worker process, run once as the pool initializer so every page job of the process
+    shares one parsed document. The reader is opened here as it can't be pickled.
+
+    :param pdf_path: Path to the PDF file.
+    """
+    global _worker_reader
+    _worker_reader = PdfReader(pdf_path, strict=False)
+
+
+def _extract_one_page(page_num):
+    """
+    Extract the text of a single PDF page, run in a worker process.
+
+    :param page_num: The page number.
+    :return: Extracted text of the page.
+    """
+    return _worker_reader.pages[page_num].extract_text() or ""
+
+
+class SpeechThread(threading.Thread):
+    """
+    A long-lived thread owning the pyttsx3 engine and running every synthesis job. The engine is created and used
+    only on this thread, since drivers are bound to the thread that initialized them (SAPI5 initializes COM there).
+
+    Attributes:
+        jobs (queue.Queue): Pending (text, file name, future) jobs, ended by None.
+    """
+    def __init__(self):
+        """
+        Initialize the thread, the engine is created once it runs.
+        """
+        super().__init__(name='speech', daemon=True)
+        self.jobs = queue.Queue()
+
+    def run(self):
+        """
+        Create the engine and synthesize the queued jobs until close is called.
+        """
+        try:
+            engine, init_error = pyttsx3.init(), None
+        except Exception as error:
+            engine, init_error = None, error
+        while (job := self.jobs.get()) is not None:
+            text, file_name, future = job
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                if init_error is not None:
+                    raise init_error
+                engine.save_to_file(text, file_name)
+                engine.runAndWait()
+            except Exception as error:
+                future.set_exception(error)
+            else:
+                future.set_result(file_name)
+        if engine is not None:
+            engine.stop()
+
+    def synthesize(self, text, file_name):
+        """
+        Queue text to be spoken into an audio file.
+
+        :param text: Text to convert to speech.
+        :param file_name: Path of the audio file to write.
+        :return: Future resolving to the file name once it is written.
+        """
+        future = Future()
+        self.jobs.put((text, file_name, future))
+        return future
+
+    def close(self):
+        """
+        Stop the thread after the jobs already queued, waiting briefly for it.
+        """
+        self.jobs.put(None)
+        self.join(timeout=1)
+
+
+class ConvertWorker(QObject):
+    """
+    Converts one PDF document to audio off the GUI thread. run() is executed on a QThread, where it looks the
+    document up in the cache and extracts the missing pages; a speech thread synthesizes them as they arrive.
+    The signals are delivered on the GUI thread.
+
+    Attributes:
+        started (pyqtSignal): Emitted with the path of the first synthesized chunk and the track name.
+        chunk_ready (pyqtSignal): Emitted with the path of every following chunk.
+        finished (pyqtSignal): Emitted with the path of the complete speech file and the track name.
+        failed (pyqtSignal): Emitted with an error message when the conversion can't be completed.
+        pages (queue.Queue): Page texts waiting for synthesis, ended by None.
+        cancelled (threading.Event): Set when the conversion is abandoned.
+        fingerprint (str): Content hash of the document, naming its cache entries, set by run().
+    """
+    started = pyqtSignal(str, str)
+    chunk_ready = pyqtSignal(str)
+    finished = pyqtSignal(str, str)
+    failed = pyqtSignal(str)
+
+    def __init__(self, converter, pdf_path):
+        """
+        Initialize the worker.
+
+        :param converter: The PdfToAudio instance providing extraction, synthesis and caching.
+        :param pdf_path: Path to the PDF file.
+        """
+        super().__init__()
+        self.converter = converter
+        self.pdf_path = pdf_path
+        self.file_name = str(pdf_path).split('.')[-2].split('\\')[-1]
+        self.pages = queue.Queue()
+        self.cancelled = threading.Event()
+        self.fingerprint = None
+
+    @pyqtSlot()
+    def run(self):
+        """
+        Convert the document, reusing cached text and speech. Runs on the worker thread.
+        """
+        try:
+            with open(self.pdf_path, 'rb') as pdf_file:
+                self.fingerprint = hashlib.blake2b(pdf_file.read(), digest_size=16).hexdigest()
+            text_cache = os.path.join(CACHE_DIR, f'{self.fingerprint}.txt')
+            speech_cache = os.path.join(CACHE_DIR, f'{self.fingerprint}.wav')
+
+            if os.path.exists(speech_cache):
+                os.utime(speech_cache)
+                self.started.emit(speech_cache, self.file_name)
+                self.finished.emit(speech_cache, self.file_name)
+            else:
+                threading.Thread(target=self.synthesize_pages, args=(speech_cache,), daemon=True).start()
+                self.produce_pages(text_cache)
+        except Exception as error:
+            self.fail(f'Reading {self.file_name} failed: {error}')
+        self.thread().quit()
+
+    def cancel(self):
+        """
+        Stop the conversion and disconnect the worker from its receivers.
+        """
+        self.cancelled.set()
+        for signal in (self.started, self.chunk_ready, self.finished, self.failed):
+            signal.disconnect()
+
+    def fail(self, message):
+        """
+        Abandon the conversion after an error, reporting it unless the conversion was already abandoned.
+
+        :param message: The error message.
+        """
+        if not self.cancelled.is_set():
+            self.cancelled.set()
+            self.failed.emit(message)
+
+    def produce_pages(self, text_cache):
+        """
+        Queue the page texts of the document for synthesis, from the text cache when available.
+
+        :param text_cache: Path of the cached text, pages are separated by form feeds.
+        """
+        try:
+            if os.path.exists(text_cache):
+                self.queue_cached_pages(text_cache)
+            else:
+                self.queue_extracted_pages(text_cache)
+        finally:
+            self.pages.put(None)
+
+    def queue_cached_pages(self, text_cache):
+        """
+        Queue the pages of a cached text, reading it a block at a time.
+
+        :param text_cache: Path of the cached text.
+        """
+        with open(text_cache, encoding='utf-8') as text_file:
+            pending = ''
+            while not self.cancelled.is_set():
+                block = text_file.read(READ_BLOCK_SIZE)
+                if not block:
+                    self.pages.put(pending)
+                    break
+                *page_texts, pending = (pending + block).split('\f')
+                for page_text in page_texts:
+                    self.pages.put(page_text)
+
+    def queue_extracted_pages(self, text_cache):
+        """
+        Queue the pages of the document as they are extracted, writing each to the text cache as it arrives.
+        The cache entry is only kept when every page was extracted.
+
+        :param text_cache: Path of the cached text.
+        """
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        complete = False
+        with NamedTemporaryFile('w', encoding='utf-8', dir=CACHE_DIR, suffix='.part', delete=False) as temp_file:
+            try:
+                for page_num, page_text in enumerate(self.converter.extract_pages(self.pdf_path)):
+                    if self.cancelled.is_set():
+                        break
+                    if page_num:
+                        temp_file.write('\f')
+                    temp_file.write(page_text)
+                    self.pages.put(page_text)
+                else:
+                    complete = True
+            finally:
+                temp_file.close()
+                if complete:
+                    os.replace(temp_file.name, text_cache)
+                else:
+                    self.converter.cleanup_tempfile(temp_file.name)
+
+    def synthesize_pages(self, speech_cache):
+        """
+        Convert the queued pages to speech chunks as they arrive. Runs on its own thread.
+
+        :param speech_cache: Path of the cached speech, written once every page is synthesized.
+        """
+        chunks = []
+        try:
+            while not self.cancelled.is_set():
+                page_text = self.pages.get()
+                if page_text is None:
+                    break
+                if not page_text.strip():
+                    continue
+                chunks.append(self.converter.text_to_speech(page_text))
+                if len(chunks) == 1:
+                    self.started.emit(chunks[0], self.file_name)
+                else:
+                    self.chunk_ready.emit(chunks[-1])
+
+            if chunks and not self.cancelled.is_set():
+                self.converter.cache_file(speech_cache, sources=chunks)
+                self.converter.evict_cache(keep=(self.fingerprint,))
+                self.finished.emit(speech_cache, self.file_name)
+        except Exception as error:
+            self.fail(f'Converting {self.file_name} to speech failed: {error}')
 
 
 class PdfToAudio:
@@ -15,9 +294,11 @@ class PdfToAudio:
 
     Attributes:
         main_window (GUI.Window): The main window of the application.
-        speech (str): The file path of the generated speech audio.
+        speech (str): The file path of the generated speech audio, set once the whole document is synthesized.
+        worker (ConvertWorker): The conversion in progress, if any.
         media_player (mp.MediaPlayer): The media player instance.
     """
+    _speech_thread = None  # Shared SpeechThread, see speech_thread
 
     def __init__(self, width, height):
         """
@@ -28,6 +309,9 @@ class PdfToAudio:
         """
         self.main_window = GUI.Window(width, height, 'Pdf to Audio', (18, 63, 79),icon='assets/img/icon.png', titlebar=True)
         self.speech = None
+        self.worker = None
+        self._temp_files = []  # Speech files created by this instance, removed when it is collected or at exit
+        weakref.finalize(self, _cleanup_files, self._temp_files)
 
         self.loadUI()
 
@@ -53,13 +337,20 @@ class PdfToAudio:
         """
         Run the main event loop of the application.
         """
-        self.main_window.show()
-        self.main_window.app.exec_()
+        self.main_window.run()
 
     def close(self):
         """
-        Close the application.
+        Close the application, stopping any conversion and waiting for the conversion threads to end first.
         """
+        if self.worker is not None:
+            self.worker.cancel()
+            self.worker = None
+        for thread in self.main_window.findChildren(QThread):
+            thread.quit()
+            thread.wait()
+        for encoder in self.main_window.findChildren(QProcess):
+            encoder.waitForFinished(-1)  # Let mp3 saves in progress complete
         sys.exit()
 
     def load_pdf(self):
@@ -74,38 +365,185 @@ class PdfToAudio:
 
     def save_audio(self):
         """
-        Save the generated audio to a file.
+        Save the generated audio to a file. Speech is kept as wav; saving to an .mp3 encodes it with ffmpeg in
+        the background. A wav is copied, never linked, so editing the saved file can't alter the cache entry.
         """
         file_name, _ = GUI.QFileDialog.getSaveFileName(caption='Save audio',
                                                        directory=self.media_player.track_name if self.media_player.track_name is not None else '',
                                                        filter="Audio Files (*.mp3 *.wav);")
-        if self.media_player.track is not None:
-            shutil.copy(self.speech, file_name)
+        if self.speech is None or not file_name:
+            return
+        if os.path.splitext(file_name)[1].lower() == '.mp3':
+            self.encode_mp3(self.speech, file_name)
+            return
+        shutil.copyfile(self.speech, file_name)  # Uses the kernel's in-place copy where the platform has one
+
+    def encode_mp3(self, speech, file_name):
+        """
+        Start encoding the speech to an mp3 file with ffmpeg, without waiting for it. The outcome is handled
+        by encoding_finished, or encoding_failed when ffmpeg can't be started.
+
+        :param speech: Path of the wav speech file.
+        :param file_name: Path of the mp3 file.
+        """
+        encoder = QProcess(self.main_window)  # Owned by the window until it finishes
+        encoder.finished.connect(partial(self.encoding_finished, encoder, file_name))
+        encoder.errorOccurred.connect(partial(self.encoding_failed, encoder, speech, file_name))
+        encoder.start('ffmpeg', ['-y', '-loglevel', 'error', '-i', speech, '-c:a', 'libmp3lame', '-q:a', '5', file_name])
+
+    def encoding_finished(self, encoder, file_name, exit_code, exit_status):
+        """
+        Report an mp3 encoding that failed, removing the incomplete file.
+
+        :param encoder: The ffmpeg QProcess.
+        :param file_name: Path of the mp3 file.
+        :param exit_code: Exit code of ffmpeg.
+        :param exit_status: QProcess.NormalExit, or QProcess.CrashExit when ffmpeg crashed.
+        """
+        if exit_status != QProcess.NormalExit or exit_code != 0:
+            errors = bytes(encoder.readAllStandardError()).decode(errors='replace').strip()
+            self.cleanup_tempfile(file_name)
+            self.main_window.show_error(f'Encoding {file_name} failed: {errors or f"ffmpeg exited with {exit_code}"}')
+        encoder.deleteLater()
+
+    def encoding_failed(self, encoder, speech, file_name, error):
+        """
+        Save the speech as wav when ffmpeg can't be started, under the chosen name with a .wav extension.
+
+        :param encoder: The ffmpeg QProcess.
+        :param speech: Path of the wav speech file.
+        :param file_name: Path of the mp3 file that was asked for.
+        :param error: The QProcess.ProcessError, other errors are followed by finished.
+        """
+        if error != QProcess.FailedToStart:
+            return
+        wav_name = os.path.splitext(file_name)[0] + '.wav'
+        shutil.copyfile(speech, wav_name)
+        self.main_window.show_error(f'ffmpeg could not be started, so the speech was saved as wav to {wav_name}')
+        encoder.deleteLater()
 
     def pdf_to_audio(self, pdf_path):
         """
-        Convert a PDF file to audio.
+        Convert a PDF file to audio on a worker thread, keeping the GUI responsive. Extracted text and
+        synthesized speech are cached by a fingerprint of the PDF content, so converting the same document
+        again skips the work already done.
+
+        Playback starts as soon as the first page is spoken and the following pages are appended to the player
+        as they become ready.
 
         :param pdf_path: Path to the PDF file.
         """
-        text = self.extract_text(pdf_path)
-        file_name = str(pdf_path).split('.')[-2].split('\\')[-1]
-        self.speech = self.text_to_speech(text)
-        self.media_player.load_audio(file=self.speech, file_name=file_name)
+        if self.worker is not None:
+            self.worker.cancel()
+        self.speech = None
+
+        self.worker = ConvertWorker(self, pdf_path)
+        thread = QThread(self.main_window)
+        thread.worker = self.worker  # Keeps the worker alive until the thread is deleted
+        self.worker.moveToThread(thread)
+        self.worker.started.connect(self.speech_started)
+        self.worker.chunk_ready.connect(self.media_player.append_audio)
+        self.worker.finished.connect(self.speech_finished)
+        self.worker.failed.connect(self.speech_failed)
+        thread.started.connect(self.worker.run)
+        thread.finished.connect(thread.deleteLater)
+        thread.start()
+
+    def speech_started(self, chunk, file_name):
+        """
+        Load the first speech chunk of a conversion into the media player.
+
+        :param chunk: Path of the first speech chunk.
+        :param file_name: Name of the track.
+        """
+        self.media_player.load_audio(file=chunk, file_name=file_name, complete=False)
+
+    def speech_finished(self, speech, file_name):
+        """
+        Keep the complete speech file of the finished conversion for saving, and let the media player stop at
+        the end of its track.
+
+        :param speech: Path of the complete speech file.
+        :param file_name: Name of the track.
+        """
+        self.speech = speech
+        self.worker = None
+        self.media_player.finish_track()
+
+    def speech_failed(self, message):
+        """
+        End the track at the chunks played so far and report why the conversion stopped.
+
+        :param message: The error message.
+        """
+        self.worker = None
+        self.media_player.finish_track()
+        self.main_window.show_error(message)
 
-    def extract_text(self, pdf_path):
+    def cache_file(self, cache_path, sources):
         """
-        Extract text from a PDF file.
+        Atomically write a speech entry to the cache.
+
+        :param cache_path: Path of the cache entry.
+        :param sources: Paths of wav files to join into a single wav, all in the same format.
+        """
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with NamedTemporaryFile(dir=CACHE_DIR, suffix='.part', delete=False) as temp_file:
+            with wave.open(temp_file, 'wb') as speech_file:
+                for index, source in enumerate(sources):
+                    with wave.open(source, 'rb') as chunk_file:
+                        if index == 0:
+                            speech_file.setparams(chunk_file.getparams())
+                        while frames := chunk_file.readframes(MERGE_BLOCK_FRAMES):
+                            speech_file.writeframes(frames)
+        os.replace(temp_file.name, cache_path)
+
+    def evict_cache(self, keep=()):
+        """
+        Remove the least recently used documents from the cache, keeping the newest CACHE_SIZE, and the .part
+        files of writes interrupted more than STALE_PART_AGE seconds ago. The document of the current speech is
+        never removed.
+
+        :param keep: Fingerprints of other documents in use, never removed either.
+        """
+        keep = set(keep)
+        speech = self.speech
+        if speech is not None:
+            keep.add(os.path.splitext(os.path.basename(speech))[0])
+        entries = {}
+        stale_before = time.time() - STALE_PART_AGE
+        for entry in os.scandir(CACHE_DIR):
+            fingerprint, extension = os.path.splitext(entry.name)
+            if extension == '.part':
+                if entry.stat().st_mtime < stale_before:
+                    self.cleanup_tempfile(entry.path)
+            elif extension in ('.txt', '.wav') and fingerprint not in keep:
+                entries.setdefault(fingerprint, []).append((entry.stat().st_mtime, entry.path))
+        by_age = sorted(entries.values(), key=lambda files: max(files)[0], reverse=True)
+        for files in by_age[CACHE_SIZE:]:
+            for _, path in files:
+                self.cleanup_tempfile(path)
+
+    def extract_pages(self, pdf_path):
+        """
+        Extract the text of a PDF file page by page, in page order.
 
         :param pdf_path: Path to the PDF file.
-        :return: Extracted text.
+        :return: Generator of the page texts.
         """
-        pdf_reader = PyPDF2.PdfReader(pdf_path)
-        text = ""
-        for page_num in range(len(pdf_reader.pages)):
-            page = pdf_reader.pages[page_num]
-            text += page.extract_text()
-        return text
+        pdf_reader = PdfReader(pdf_path, strict=False)
+        page_count = len(pdf_reader.pages)
+        if page_count < PARALLEL_MIN_PAGES:
+            for page in pdf_reader.pages:
+                yield page.extract_text() or ""
+        else:
+            # Spawned, not forked: this process already runs Qt, libvlc and the speech thread
+            executor = ProcessPoolExecutor(max_workers=os.cpu_count(), mp_context=multiprocessing.get_context('spawn'),
+                                           initializer=_open_worker_reader, initargs=(str(pdf_path),))
+            try:
+                yield from executor.map(_extract_one_page, range(page_count), chunksize=4)
+            finally:
+                executor.shutdown(cancel_futures=True)  # Drops pending pages when a conversion is cancelled
 
     def text_to_speech(self, text):
         """
@@ -114,14 +552,24 @@ class PdfToAudio:
         :param text: Text to convert to speech.
         :return: File path of the generated speech audio.
         """
-        engine = pyttsx3.init()
-        with NamedTemporaryFile(delete=False, suffix='.mp3') as temp_file:
-            temp_filename = temp_file.name
-            temp_file.close()
-            engine.save_to_file(text, temp_filename)
-            engine.runAndWait()
-            atexit.register(self.cleanup_tempfile, temp_filename)
-        return temp_filename
+        fd, temp_filename = mkstemp(suffix='.wav')  # The engines' native format, no encoding while speaking
+        os.close(fd)
+        self._temp_files.append(temp_filename)
+        return self.speech_thread().synthesize(text, temp_filename).result()
+
+    @classmethod
+    def speech_thread(cls):
+        """
+        Return the speech thread shared by all conversions, starting it on first use.
+
+        :return: The SpeechThread.
+        """
+        with _speech_lock:
+            if cls._speech_thread is None:
+                cls._speech_thread = SpeechThread()
+                cls._speech_thread.start()
+                atexit.register(cls._speech_thread.close)
+        return cls._speech_thread
 
     def cleanup_tempfile(self, temp_filename):
         """
@@ -132,13 +580,6 @@ class PdfToAudio:
         if os.path.exists(temp_filename):
             os.remove(temp_filename)
 
-    def __del__(self):
-        """
-        Destructor to clean up temporary files and resources.
-        """
-        if GUI.Widget.check_path(GUI.Widget, 'assets/temp', 'folder'):
-            shutil.rmtree('assets\\temp', True)
-
 
 if __name__ == '__main__':
     PTA = PdfToAudio(400, 200)
@@ -2,9 +2,34 @@ import vlc
 import GUI
 import math
 import time
+from functools import lru_cache
 from pathlib import Path
+from PyQt5.QtCore import QObject, pyqtSignal
 from GUI import Layout, Label, Button, ScaleBar
 
+@lru_cache(maxsize=4096)
+def _format_time(seconds):
+    """
+    Format time in seconds to a MM:SS string format, memoized since the same times are shown on every tick.
+
+    :param seconds: Time in whole seconds.
+    :return: Formatted time string.
+    """
+    mins, secs = divmod(seconds, 60)
+    return f"{mins:02}:{secs:02}"
+
+
+class PlayerEvents(QObject):
+    """
+    A bridge re-emitting VLC events as Qt signals, VLC calls its event callbacks from its own threads
+    where calling back into libvlc can deadlock.
+    """
+    playing = pyqtSignal()
+    time_changed = pyqtSignal(int)
+    ended = pyqtSignal()
+    parsed = pyqtSignal(object)
+
+
 class MediaPlayer:
     """
     A class to represent a media player widget using VLC for audio playback and PyQt5 for the GUI.
@@ -15,26 +40,47 @@ class MediaPlayer:
         """
         self.track = None
         self.track_name = None
+        self.track_list = None
+        self.track_durations = []  # Duration in seconds of every media in the track list
+        self.track_complete = True  # False while more media may still be appended to the track list
         self.player = vlc.MediaPlayer()
+        self.list_player = vlc.MediaListPlayer()
+        self.list_player.set_media_player(self.player)
+        self.pending_seek = None  # Time in milliseconds to seek to once the player starts, and whether to pause there
+        self.events = PlayerEvents()
+        self.events.playing.connect(self.apply_pending_seek)
+        self.events.time_changed.connect(self.update_player)
+        self.events.ended.connect(self.track_ended)
+        self.events.parsed.connect(self.media_parsed)
+        player_events = self.player.event_manager()
+        player_events.event_attach(vlc.EventType.MediaPlayerPlaying, lambda event: self.events.playing.emit())
+        player_events.event_attach(vlc.EventType.MediaPlayerTimeChanged,
+                                   lambda event: self.events.time_changed.emit(event.u.new_time))
+        self.list_player.event_manager().event_attach(vlc.EventType.MediaListPlayerPlayed,
+                                                      lambda event: self.events.ended.emit())
         self.track_speed = 1
         self.track_speed_list = [0.5, 1, 1.5, 2]
+        self.track_speed_idx = 1  # Index of track_speed in track_speed_list
+        self._speed_icons = [f'assets/img/speed_x{speed}.png' for speed in self.track_speed_list]
         self.track_current_time = 0
         self.track_total_time = 0
-        self.track_timer = GUI.QTimer()
-        self.track_timer.timeout.connect(self.update_player)
-        self.track_update_rate = 1000  # Corrected the typo from tracK_update_rate to track_update_rate
+        self._last_bar_val = 0  # Progress bar value and time label text last shown, see show_progress
+        self._last_time_str = '00:00'
+        self.track_update_rate = 200  # Minimum milliseconds between two progress updates
+        self._last_update = 0  # time.monotonic() of the last progress update
         self.track_val = 0
         self.track_timm = None
         self.interactive_buttons = {}
         self.button_size = GUI.QSize(50, 40)
 
-    def load_audio(self, file_path=None, file=None, file_name='DEFAULT'):
+    def load_audio(self, file_path=None, file=None, file_name='DEFAULT', complete=True):
         """
-        Load audio file into the media player.
+        Load audio file into the media player, replacing the current track list.
 
         :param file_path: Path to the audio file.
         :param file: Direct audio file content.
         :param file_name: Name of the track.
+        :param complete: False when more audio will be appended, until finish_track is called.
         """
         if file_path:
             audio_path = GUI.Widget.check_path(file_path, 'audio')
@@ -43,33 +89,136 @@ class MediaPlayer:
 
         self.track_name = file_name
         if audio_path:
+            self.stop()
+            self.track_complete = complete
             self.track = vlc.Media(audio_path)
-            self.track.parse()
-            self.player.set_media(self.track)
+            self.track_list = vlc.MediaList([self.track])
+            self.list_player.set_media_list(self.track_list)
             self.track_title.setText(self.track_name)
-            self.track_total_time = self.track.get_duration() // 1000
-            self.track_total_time_label.setText(self.format_time(self.track_total_time))
+            self.track_durations = [0]
+            self.track_total_time = 0
+            self.track_total_time_label.setText(_format_time(0))
+            self.parse_media(self.track)
+
+    def append_audio(self, file):
+        """
+        Append an audio file to the end of the loaded track, used for speech that is still being synthesized.
+
+        :param file: Path to the audio file.
+        """
+        media = vlc.Media(file)
+        self.track_list.lock()  # The list player walks the list on its own thread
+        try:
+            self.track_list.add_media(media)
+        finally:
+            self.track_list.unlock()
+        self.track_durations.append(0)
+        self.parse_media(media)
+        if self.player.get_state() == vlc.State.Ended:
+            self.list_player.play_item_at_index(len(self.track_durations) - 1)
+
+    def finish_track(self):
+        """
+        Mark the track list as complete, stopping the player if it already played everything appended so far.
+        """
+        self.track_complete = True
+        if self.player.get_state() == vlc.State.Ended:
+            self.stop()
+
+    def track_ended(self):
+        """
+        Stop the player at the end of the track list, unless more audio is still to be appended; the player
+        then stays ended so append_audio resumes playback with the next media.
+        """
+        if self.track_complete:
+            self.stop()
+        elif self.track_total_time:
+            self.track_current_time = self.track_total_time  # The throttle may have dropped the last tick
+            self.show_progress(100)
+
+    def parse_media(self, media):
+        """
+        Read the duration of a media in the background, media_parsed adds it to the track once VLC is done.
+
+        :param media: The vlc.Media to parse.
+        """
+        media.event_manager().event_attach(vlc.EventType.MediaParsedChanged,
+                                           lambda event: self.events.parsed.emit(media))
+        media.parse_with_options(vlc.MediaParseFlag.local, -1)
+
+    def media_parsed(self, media):
+        """
+        Record the duration of a parsed media of the track list and update the total time.
+
+        :param media: The parsed vlc.Media, ignored when it is no longer part of the track list.
+        """
+        index = self.index_of(media)
+        if index < 0 or index >= len(self.track_durations):
+            return
+        self.track_durations[index] = max(0, media.get_duration()) // 1000
+        self.track_total_time = sum(self.track_durations)
+        self.track_total_time_label.setText(_format_time(int(self.track_total_time)))
+
+    def current_index(self):
+        """
+        Return the index of the media currently set in the player, 0 when none is.
+        """
+        media = self.player.get_media()
+        return max(0, self.index_of(media)) if media is not None else 0
+
+    def index_of(self, media):
+        """
+        Return the index of a media in the track list, holding the list lock as libvlc requires.
+
+        :param media: The vlc.Media to look up.
+        :return: The index, -1 when the media is not in the track list.
+        """
+        if self.track_list is None:
+            return -1
+        self.track_list.lock()
+        try:
+            return self.track_list.index_of_item(media)
+        finally:
+            self.track_list.unlock()
+
+    def current_time(self):
+        """
+        Return the playback time in seconds, counted from the start of the track list.
+        """
+        index = self.current_index()
+        return sum(self.track_durations[:index]) + max(0, self.player.get_time()) // 1000
+
+    def locate(self, seconds):
+        """
+        Find the media of the track list playing at a given time.
+
+        :param seconds: Time in seconds from the start of the track list.
+        :return: Tuple of the media index and the time in seconds within that media.
+        """
+        for index, duration in enumerate(self.track_durations):
+            if seconds < duration or index == len(self.track_durations) - 1:
+                return index, seconds
+            seconds -= duration
+        return 0, seconds
 
     def play(self):
         """
         Play the loaded audio track.
         """
-        self.track_timer.start(1000)
-        self.player.play()
+        self.list_player.play()
 
     def pause(self):
         """
         Pause the currently playing audio track.
         """
         self.player.pause()
-        if self.track_timer.isActive():
-            self.track_timer.stop()
+        self.update_player(self.player.get_time(), force=True)  # The throttle may have dropped the last tick
 
     def stop(self):
         """
         Stop the currently playing audio track and reset the player.
         """
-        self.player.stop()
+        self.list_player.stop()
         self.reset_player()
 
     def skip_forward(self, seconds):
@@ -78,8 +227,7 @@ class MediaPlayer:
 
         :param seconds: Number of seconds to skip forward.
         """
-        current_time = self.player.get_time()
-        self.player.set_time(current_time + (seconds * 1000))
+        self.seek(self.current_time() + seconds)
 
     def skip_backwards(self, seconds):
         """
@@ -87,22 +235,37 @@ class MediaPlayer:
 
         :param seconds: Number of seconds to skip backwards.
         """
-        current_time = self.player.get_time()
-        self.player.set_time(max(0, current_time - (seconds * 1000)))
+        self.seek(max(0, self.current_time() - seconds))
 
     def seek(self, seconds):
         """
-        Seek to a specific time in the track.
+        Seek to a specific time in the track. Ignored until VLC has parsed the duration of every media up to
+        that time, as the time can't be located before.
 
-        :param seconds: Time to seek to, in seconds.
+        :param seconds: Time to seek to, in seconds, counted from the start of the track list.
         """
-        if self.player.get_state() != vlc.State.Playing:
-            self.play()
-            time.sleep(0.01)
+        if not self.track_total_time:
+            return
+        index, seconds = self.locate(seconds)
+        if 0 in self.track_durations[:index + 1]:
+            return
+        state = self.player.get_state()
+        if state in (vlc.State.Playing, vlc.State.Paused) and index == self.current_index():
             self.player.set_time(seconds * 1000)
-            self.pause()
         else:
-            self.player.set_time(seconds * 1000)
+            self.pending_seek = (seconds * 1000, state != vlc.State.Playing)
+            self.list_player.play_item_at_index(index)
+
+    def apply_pending_seek(self):
+        """
+        Seek to the time requested while the player was not playing the right media, once it has started.
+        """
+        if self.pending_seek is not None:
+            milliseconds, pause = self.pending_seek
+            self.pending_seek = None
+            self.player.set_time(milliseconds)
+            if pause:
+                self.pause()
 
     def set_speed(self, speed):
         """
@@ -116,15 +279,10 @@ class MediaPlayer:
         """
         Switch to the next playback speed in the track speed list.
         """
-        for index, current_speed in enumerate(self.track_speed_list):
-            if current_speed == self.track_speed:
-                if index + 1 < len(self.track_speed_list):
-                    self.track_speed = self.track_speed_list[index + 1]
-                else:
-                    self.track_speed = 0.5
-                self.set_speed(self.track_speed)
-                self.speed_button.update_image(f'assets/img/speed_x{self.track_speed}.png')
-                return
+        self.track_speed_idx = (self.track_speed_idx + 1) % len(self.track_speed_list)
+        self.track_speed = self.track_speed_list[self.track_speed_idx]
+        self.set_speed(self.track_speed)
+        self.speed_button.update_image(self._speed_icons[self.track_speed_idx])
 
     def load_ui(self, container_layout, mode='basic'):
         """
@@ -146,10 +304,8 @@ class MediaPlayer:
                                   action=self.track_bar_clicked)
         self.track_total_time_label = Label(self.bar_layout, '00:00')
 
-        self.track_bar.add_style('none', 'background-color', 'grey')
-        self.track_bar.add_style('none', 'border-radius', '5px')
-        self.track_bar.add_style('chunk', 'margin', '0px')
-        self.track_bar.add_style('chunk','border-radius','5px')
+        self.track_bar.set_styles({'none': {'background-color': 'grey', 'border-radius': '5px'},
+                                   'chunk': {'margin': '0px', 'border-radius': '5px'}})
 
         self.play_button = Button(self.buttons_layout, name='mp_play_button', icon='assets/img/play_button.png', action=self.play,
                                   size=self.button_size)
@@ -160,35 +316,44 @@ class MediaPlayer:
         self.speed_button = Button(self.buttons_layout, name='mp_speed_button', icon='assets/img/speed_x1.png', action=self.switch_speed,
                                    size=self.button_size)
 
-    def format_time(self, seconds):
-        """
-        Format time in seconds to a MM:SS string format.
-
-        :param seconds: Time in seconds.
-        :return: Formatted time string.
-        """
-        mins, secs = divmod(seconds, 60)
-        return f"{mins:02}:{secs:02}"
-
     def reset_player(self):
         """
         Reset the player to its initial state.
         """
         self.track_current_time = 0
-        self.track_bar.setValue(0)
-        self.track_current_time_label.setText(self.format_time(self.track_current_time))
-        self.track_timer.stop()
+        self.pending_seek = None
+        self.show_progress(0)
 
-    def update_player(self):
+    def show_progress(self, bar_value):
         """
-        Update the player state, track time, and progress bar.
+        Show the progress bar value and the current time, skipping the widgets whose content is unchanged.
+
+        :param bar_value: Progress bar value, between 0 and 100.
         """
-        if self.track_current_time <= self.track_total_time - 1:
-            self.track_current_time = self.player.get_time() // 1000
-            self.track_bar.setValue(int((self.track_current_time / self.track_total_time) * 100))
-            self.track_current_time_label.setText(self.format_time(self.track_current_time))
-        else:
-            self.stop()
+        if bar_value != self._last_bar_val:
+            self._last_bar_val = bar_value
+            self.track_bar.setValue(bar_value)
+        time_str = _format_time(int(self.track_current_time))
+        if time_str != self._last_time_str:
+            self._last_time_str = time_str
+            self.track_current_time_label.setText(time_str)
+
+    def update_player(self, media_time, force=False):
+        """
+        Update the track time and progress bar when VLC reports a new playback time, at most once every
+        track_update_rate milliseconds.
+
+        :param media_time: Playback time in milliseconds within the current media.
+        :param force: Update even within track_update_rate of the last update, used when playback halts.
+        """
+        now = time.monotonic()
+        if not self.track_total_time or (not force and (now - self._last_update) * 1000 < self.track_update_rate):
+            return
+        if self.player.get_state() not in (vlc.State.Playing, vlc.State.Paused):
+            return  # Queued before a stop
+        self._last_update = now
+        self.track_current_time = sum(self.track_durations[:self.current_index()]) + max(0, media_time) // 1000
+        self.show_progress(min(100, self.track_current_time * 100 // self.track_total_time))
 
     def track_bar_clicked(self, event):
         """
@@ -196,10 +361,11 @@ class MediaPlayer:
 
         :param event: The click event on the track bar.
         """
+        if not self.track_total_time:
+            return  # Nothing parsed yet to seek in
         click_position = event.pos().x() / self.track_bar.width()
         new_track_value = int(
             click_position * (self.track_bar.maximum() - self.track_bar.minimum()) + self.track_bar.minimum())
         self.track_current_time = math.ceil((new_track_value / 100) * self.track_total_time)
-        self.track_bar.setValue(new_track_value)
-        self.track_current_time_label.setText(self.format_time(self.track_current_time))
+        self.show_progress(new_track_value)
         self.seek(self.track_current_time)